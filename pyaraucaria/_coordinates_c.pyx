@@ -0,0 +1,84 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+C implementation of the sexagesimal parse hot path of `coordinates.py`
+
+Built only when Cython is available at install time; `coordinates.py` falls
+back to its pure-Python scanner when this module is missing.
+
+Licence: MIT
+"""
+
+
+cdef inline bint _is_separator(Py_UCS4 ch):
+    return (ch == u':' or ch == u' ' or ch == u'-'
+            or ch == u'h' or ch == u'H' or ch == u'ₕ' or ch == u'°'
+            or ch == u'm' or ch == u'M' or ch == u'ₘ' or ch == u'′' or ch == u"'")
+
+
+def parse_sexagesimal_c(unicode sexagesimal):
+    """Returns quadruple: (sign, dec/h, min, sec), see `coordinates.parse_sexagesimal`"""
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t n = len(sexagesimal)
+    cdef Py_ssize_t sec_start
+    cdef int sign = 1
+    cdef int width = 0
+    cdef long a = 0, b = 0
+    cdef double c
+    cdef Py_UCS4 ch
+
+    if n and (sexagesimal[0] == u'+' or sexagesimal[0] == u'-'):
+        if sexagesimal[0] == u'-':
+            sign = -1
+        i = 1
+
+    # field widths capped at 3/2/2 digits like the regex parser, so wider
+    # digit runs raise here and the Python dispatch gives the same verdict
+    while i < n:
+        ch = sexagesimal[i]
+        if u'0' <= ch <= u'9':
+            a = a * 10 + (<long>ch - 48)
+            width += 1
+            i += 1
+        else:
+            break
+    if width == 0 or width > 3 or i >= n or not _is_separator(sexagesimal[i]):
+        raise ValueError('{} can not be converted to decimal representation'.format(sexagesimal))
+    i += 1
+
+    width = 0
+    while i < n:
+        ch = sexagesimal[i]
+        if u'0' <= ch <= u'9':
+            b = b * 10 + (<long>ch - 48)
+            width += 1
+            i += 1
+        else:
+            break
+    if width == 0 or width > 2 or i >= n or not _is_separator(sexagesimal[i]):
+        raise ValueError('{} can not be converted to decimal representation'.format(sexagesimal))
+    i += 1
+
+    width = 0
+    sec_start = i
+    while i < n:
+        ch = sexagesimal[i]
+        if u'0' <= ch <= u'9':
+            width += 1
+            i += 1
+        else:
+            break
+    if width == 0 or width > 2:
+        raise ValueError('{} can not be converted to decimal representation'.format(sexagesimal))
+    if i < n and sexagesimal[i] == u'.':
+        i += 1
+        while i < n:
+            ch = sexagesimal[i]
+            if u'0' <= ch <= u'9':
+                i += 1
+            else:
+                break
+    # anything after the seconds field is ignored, like the regex parser does;
+    # float() gives the same correctly rounded value as the Python parsers
+    c = float(sexagesimal[sec_start:i])
+
+    return sign, a, b, c
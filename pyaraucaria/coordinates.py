@@ -9,33 +9,41 @@ Useful functions
 - `dec_to_decimal`
 - `ra_to_sexagesimal`
 - `dec_to_sexagesimal`
+- `ra_array_to_decimal`
+- `dec_array_to_decimal`
 
 Licence: MIT
 """
 
 import re
+from functools import lru_cache
 import ephem
+import numpy as np
 import math
 import datetime
 from astropy.coordinates import SkyCoord, EarthLocation, FK5
 import astropy.units as u
 
 
+@lru_cache(maxsize=4096)
 def ra_to_decimal(hms):
     # type: (str) -> float
     return hourangle_to_decimal_deg(hms)
 
 
+@lru_cache(maxsize=4096)
 def dec_to_decimal(dms):
     # type: (str) -> float
     return deg_to_decimal_deg(dms)
 
 
+@lru_cache(maxsize=4096)
 def ra_to_sexagesimal(deg, sep=':', precision=3):
     # type: (float, str, int) -> str
     return to_hourangle_sexagesimal(deg, sep=sep, sign=False, precision=precision)
 
 
+@lru_cache(maxsize=4096)
 def dec_to_sexagesimal(deg, sep=':', precision=3):
     # type: (float, str, int) -> str
     return to_degminsec_sexagesimal(deg, sep=sep, sign=True, precision=precision)
@@ -51,32 +59,88 @@ def to_degminsec_sexagesimal(deg, sep=':', sign=True, precision=3):
     return format_sexagesimal(deg, 1, sign=sign, sep=sep, precision=precision)
 
 
-def hourangle_to_decimal_deg(hms):
-    # type: (str) -> float
-    try:
-        val = float(hms)
-    except ValueError:
+def hourangle_to_decimal_deg(hms, _round=True):
+    # type: (str, bool) -> float
+    val = None
+    if isinstance(hms, str):
+        # padding would make the separator scan below misroute plain decimals
+        hms = hms.strip()
+    # sexagesimal strings are the common case here: a cheap separator scan
+    # skips raising and catching ValueError from float() on every such call
+    if not (isinstance(hms, str) and (':' in hms or ' ' in hms or 'h' in hms or 'H' in hms)):
+        try:
+            val = float(hms)
+        except ValueError:
+            pass
+    if val is None:
         sign, h, m, s = parse_sexagesimal(hms)
         val = sign * ((((s / 60) + m) / 60) + h) / 24 * 360
-    return round(val, 6)
-
-
-def deg_to_decimal_deg(dms):
-    # type: (str) -> float
-    try:
-        val = float(dms)
-    except ValueError:
+    # pass _round=False to keep all bits, e.g. before reformatting with
+    # precision > 6 digits
+    if _round:
+        return round(val, 6)
+    return val
+
+
+def deg_to_decimal_deg(dms, _round=True):
+    # type: (str, bool) -> float
+    val = None
+    if isinstance(dms, str):
+        dms = dms.strip()
+    if not (isinstance(dms, str) and (':' in dms or ' ' in dms or '°' in dms)):
+        try:
+            val = float(dms)
+        except ValueError:
+            pass
+    if val is None:
         sign, d, m, s = parse_sexagesimal(dms)
         val = sign * ((((s / 60) + m) / 60) + d)
-    return round(val, 6)
+    if _round:
+        return round(val, 6)
+    return val
 
 _sexagesimal_parser = re.compile(r"(?P<sign>[+\-])?(?P<A>\d\d?\d?)[ :\-hHₕ°](?P<B>\d\d?)[ :\-mMₘ′'](?P<C>\d\d?(?:\.\d*)?)")
 
+# maps all accepted separators to ':' and drops trailing second marks, so the
+# fast path below can scan with a single split instead of the regex
+_sexagesimal_separators = str.maketrans({**dict.fromkeys(" -hHₕ°mMₘ′'", ':'), **dict.fromkeys('″"', None)})
+_sexagesimal_match = _sexagesimal_parser.match
+
+try:
+    # compiled scanner, built when Cython was available at install time
+    from pyaraucaria._coordinates_c import parse_sexagesimal_c as _parse_sexagesimal_c
+except ImportError:
+    _parse_sexagesimal_c = None
+
 
-def parse_sexagesimal(sexagesimal):
+def parse_sexagesimal(sexagesimal, _int=int, _float=float, _match=_sexagesimal_match):
     # type: (str) -> (int, int, int, float)
     """Returns quadruple: (sign, dec/h, min, sec)"""
-    v = _sexagesimal_parser.match(sexagesimal)
+    if _parse_sexagesimal_c is not None:
+        try:
+            return _parse_sexagesimal_c(sexagesimal)
+        except (ValueError, TypeError):
+            pass  # let the regex below try the formats the C scanner rejects
+    # fast path: normalize separators and split, no regex engine involved
+    try:
+        if sexagesimal[0] in '+-':
+            sign = -1 if sexagesimal[0] == '-' else 1
+            body = sexagesimal[1:]
+        else:
+            sign = 1
+            body = sexagesimal
+        parts = body.translate(_sexagesimal_separators).split(':', 3)
+        seconds = parts[2]
+        dot = seconds.find('.')
+        # enforce the regex field widths (3/2/2 digits) so malformed strings
+        # like '1234:00:00' fall through and get rejected there
+        if len(parts[0]) > 3 or len(parts[1]) > 2 or (dot == -1 and len(seconds) > 2) or dot > 2:
+            raise ValueError(sexagesimal)
+        return sign, _int(parts[0]), _int(parts[1]), _float(seconds)
+    except (ValueError, IndexError):
+        pass
+    # fallback: regex handles the exotic formats the scanner gives up on
+    v = _match(sexagesimal)
     if v is None:
         raise ValueError('{} can not be converted to decimal representation'.format(sexagesimal))
     v = v.groupdict()
@@ -84,27 +148,115 @@ def parse_sexagesimal(sexagesimal):
         sign = -1
     else:
         sign = 1
-    return sign, int(v['A']), int(v['B']), float(v['C'])
+    return sign, _int(v['A']), _int(v['B']), _float(v['C'])
 
 
 def format_sexagesimal(deg, multiplier, sign, sep=':', precision=3):
     # type: (float, float, bool, str, int) -> str
+    if sep == ':' and precision == 3:
+        # fast path for the defaults of the public wrappers: static format
+        # specs, no separator fiddling
+        sig = 1 if deg > 0 else -1
+        total = int(round(sig * multiplier * deg * 3600000))
+        m_total, s_scaled = divmod(total, 60000)
+        h, m = divmod(m_total, 60)
+        s_int, s_frac = divmod(s_scaled, 1000)
+        if sign:
+            return f"{'+' if sig > 0 else '-'}{h:02d}:{m:02d}:{s_int:02d}.{s_frac:03d}"
+        return f'{h:02d}:{m:02d}:{s_int:02d}.{s_frac:03d}'
+
     if len(sep) == 1:
         sep = sep * 2
 
     sig = 1 if deg > 0 else -1
-    h = sig * multiplier * deg
-    m = (h * 60) % 60
-    s = (m * 60) % 60
-    return ('{}{:02d}{}{:02d}{}{:0'+ f'{precision + 3}'+ '.' + f'{precision}' + 'f}{}').format(
-        ('+' if sig > 0 else '-') if sign else '',
-        int(h),
-        sep[0],
-        int(m),
-        sep[1],
-        s,
-        sep[2] if len(sep) == 3 else ''
-    )
+    # one rounding to scaled integer seconds, then exact integer divmods:
+    # avoids the 59.999... artifacts of chained float modulo arithmetic
+    unit = 10 ** precision
+    total = int(round(sig * multiplier * deg * 3600 * unit))
+    m_total, s_scaled = divmod(total, 60 * unit)
+    h, m = divmod(m_total, 60)
+    s_int, s_frac = divmod(s_scaled, unit)
+    sign_char = ('+' if sig > 0 else '-') if sign else ''
+    tail = sep[2] if len(sep) == 3 else ''
+    seconds = f'{s_int:02d}.{s_frac:0{precision}d}' if precision else f'{s_int:03d}'
+    return f'{sign_char}{h:02d}{sep[0]}{m:02d}{sep[1]}{seconds}{tail}'
+
+
+def ra_array_to_decimal(hms_array):
+    # type: (list or np.ndarray) -> np.ndarray
+    """Converts a whole array of hourangle coordinates to decimal degrees at once
+
+    Accepts sexagesimal strings, decimal strings or floats; returns float64 array.
+    For catalog-scale inputs this amortizes the per-call overhead of `ra_to_decimal`.
+    """
+    return _sexagesimal_array_to_decimal(hms_array, hourangle=True)
+
+
+def dec_array_to_decimal(dms_array):
+    # type: (list or np.ndarray) -> np.ndarray
+    """Converts a whole array of deg:min:sec coordinates to decimal degrees at once
+
+    Accepts sexagesimal strings, decimal strings or floats; returns float64 array.
+    For catalog-scale inputs this amortizes the per-call overhead of `dec_to_decimal`.
+    """
+    return _sexagesimal_array_to_decimal(dms_array, hourangle=False)
+
+
+def _sexa_to_deg_kernel(sign, a, b, c):
+    # type: (np.ndarray, np.ndarray, np.ndarray, np.ndarray) -> np.ndarray
+    # same association as the scalar converters, so both paths agree
+    # bit-for-bit before rounding
+    return sign * ((((c / 60.0) + b) / 60.0) + a)
+
+
+try:
+    # optional: compile the numeric kernel with numba when available; the string
+    # splitting stays in NumPy, only float64 arrays reach the kernel
+    from numba import njit
+    _sexa_to_deg_kernel = njit(parallel=True, fastmath=True, cache=True)(_sexa_to_deg_kernel)
+except ImportError:
+    pass
+
+
+def _sexagesimal_array_to_decimal(array, hourangle):
+    # type: (list or np.ndarray, bool) -> np.ndarray
+    a = np.asarray(array)
+    if a.dtype.kind in 'iuf':
+        return _round6_array(a.astype(np.float64))
+    a = np.char.strip(a.astype(np.str_))
+    try:
+        # whole array already decimal, no sexagesimal parsing needed
+        return _round6_array(a.astype(np.float64))
+    except ValueError:
+        pass
+    sign = np.where(np.char.startswith(a, '-'), -1.0, 1.0)
+    a = np.char.lstrip(a, '+-')
+    for separator in " -hHₕ°mMₘ′'":
+        a = np.char.replace(a, separator, ':')
+    for mark in '″"':
+        a = np.char.replace(a, mark, '')
+    # elements without any separator are plain decimals and must keep their
+    # face value, like the scalar converters do - no hourangle scaling
+    is_sexa = np.char.find(a, ':') >= 0
+    p = np.char.partition(a, ':')
+    h = p[..., 0].astype(np.float64)
+    p = np.char.partition(p[..., 2], ':')
+    m = np.where(p[..., 0] == '', '0', p[..., 0]).astype(np.float64)
+    s_str = np.char.partition(p[..., 2], ':')[..., 0]
+    s = np.where(s_str == '', '0', s_str).astype(np.float64)
+    val = _sexa_to_deg_kernel(sign, h, m, s)
+    if hourangle:
+        val = val / 24 * 360
+    val = np.where(is_sexa, val, sign * h)
+    return _round6_array(val)
+
+
+def _round6_array(val):
+    # type: (np.ndarray) -> np.ndarray
+    # np.round(x, 6) rounds the scaled binary value and disagrees with the
+    # builtin round near decimal ties; use the scalar rounding so batch
+    # results match the scalar converters exactly
+    return np.fromiter((round(v, 6) for v in val.tolist()), np.float64, val.size)
 
 
 def ra_dec_epoch(ra, dec, epoch):
@@ -1,8 +1,38 @@
 import os
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from astropy.io import fits
 import numpy as np
 
+try:
+    # optional: fused single-pass statistics kernel, see fits_stat
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _fused_min_max_mean_std(flat):
+        mn = flat[0]
+        mx = flat[0]
+        s = 0.0
+        s2 = 0.0
+        for i in prange(flat.size):
+            v = flat[i]
+            mn = min(mn, v)
+            mx = max(mx, v)
+            s += v
+            s2 += v * v
+        mean = s / flat.size
+        # clamp: catastrophic cancellation can push the operand below zero
+        # for float data with large mean and tiny variance
+        var = s2 / flat.size - mean * mean
+        if var < 0.0:
+            var = 0.0
+        return mn, mx, mean, np.sqrt(var)
+except ImportError:
+    _fused_min_max_mean_std = None
+
+# dtyp string -> numpy dtype for save_fits_from_array; 'sideint16' and 'none'
+# are handled separately
+_DTYPE_MAP = {'int32': np.int32, 'int16': np.int16}
+
 def save_fits_from_array(array,
                          folder: str,
                          file_name: str,
@@ -12,7 +42,8 @@ def save_fits_from_array(array,
                          do_not_scale_image_data: bool = False,
                          ignore_blank: bool = False,
                          uint: bool = False,
-                         scale_back: bool or None = None):
+                         scale_back: bool or None = None,
+                         checksum: bool = False):
     """
     Save fits file from array to selected location.
     Parameters
@@ -27,6 +58,8 @@ def save_fits_from_array(array,
     ignore_blank - astropy PrimaryHDU  parameter
     uint - astropy PrimaryHDU  parameter
     scale_back - astropy PrimaryHDU  parameter
+    checksum - write CHECKSUM/DATASUM cards, default=False (computing them
+        streams the whole image once more)
     """
     if os.path.splitext(file_name)[1] == "":
         file_name = f"{file_name}.fits"
@@ -46,15 +79,11 @@ def save_fits_from_array(array,
     else:
         hdr["OCASTD"] = "No fits header provided"
 
-    if dtyp=='int32':
-        narray = np.array(array, dtype=np.int32)
-    elif dtyp=='int16':
-        narray = np.array(array, dtype=np.int16)
+    dtype = _DTYPE_MAP.get(dtyp)
+    if dtype is not None:
+        narray = np.asarray(array, dtype=dtype)
     elif dtyp=='sideint16':
-        s_array = np.array(array) - 32768
-        narray = np.array(s_array, dtype=np.int16)
-    elif dtyp=='none':
-        narray = array
+        narray = (np.asarray(array) - 32768).astype(np.int16)
     else:
         narray = array
 
@@ -65,17 +94,58 @@ def save_fits_from_array(array,
                           uint=uint,
                           scale_back=scale_back)
     hdul = fits.HDUList([hdu])
-    hdul.writeto(file_name, overwrite=overwrite)
+    hdul.writeto(file_name, overwrite=overwrite, output_verify='ignore', checksum=checksum)
     if dtyp=='sideint16':
-        hdul2 = fits.open(file_name)
-        hdul2[0].header['BZERO'] = 32768
-        hdul2.writeto(file_name, overwrite=True)
+        # patch BZERO in place - memmap keeps the image data on disk, so
+        # only the 2880-byte header block is read and rewritten
+        with fits.open(file_name, mode='update', memmap=True) as hdul2:
+            hdul2[0].header['BZERO'] = 32768
 
 # Lets Follow the FitS standard version 4, as defined in
 # https://fits.gsfc.nasa.gov/fits_standard.html
 # https://fits.gsfc.nasa.gov/standard40/fits_standard40aa-le.pdf
 # https://heasarc.gsfc.nasa.gov/docs/fcg/common_dict.html may be also useful
 
+# static (key, comment) pairs of the OCA header, in card order; only the
+# values and the two observatory position comments vary per call
+_FITS_HEADER_TEMPLATE = (
+    ("OCASTD", "OCA FITS HDU standard version"),
+    ("OBSERVAT", "Cerro Armazones Observatory"),
+    ("OBS-LAT", ''),
+    ("OBS-LONG", ''),
+    ("OBS-ELEV", "[m] Observatory elevation"),
+    ("ORIGIN", "Institution created this FITS file"),
+    ("TEL", ''),
+    ("DATE-OBS", "DateTime of observation start"),
+    ("JD", "Julian date of observation start"),
+    ("RA", "Requested object RA"),
+    ("DEC", "Requested object DEC"),
+    ("EQUINOX", "Requested RA DEC epoch"),
+    ("TEL_RA", "Telescope RA"),
+    ("TEL_DEC", "Telescope DEC"),
+    ("TEL_ALT", "[deg] Telescope mount ALT"),
+    ("TEL_AZ", "[deg] Telescope mount AZ"),
+    ("AIRMASS", ''),
+    ("OBSMODE", "TRACKING, GUIDING, JITTER or ELSE"),
+    ("FOCUS", "Focus position"),
+    ("ROTATOR", "[deg] Rotator position"),
+    ("OBSERVER", ''),
+    ("OBSTYPE", ''),
+    ("OBJECT", ''),
+    ("FILTER", ''),
+    ("EXPREQ", "[s] Requested exposure time"),
+    ("EXPTIME", "[s] Executed exposure time"),
+    ("DETSIZE", ''),
+    ("CCDSEC", ''),
+    ("CCD_NAME", ''),
+    ("CCD_TEMP", ''),
+    ("CCD_BINX", ''),
+    ("CCD_BINY", ''),
+    ("READ_MOD", ''),
+    ("GAIN", ''),
+    ("RNOISE", ''),
+)
+
 def fits_header(oca_std="BETA2",
                 obs="OCA",
                 obs_lat='',
@@ -115,48 +185,22 @@ def fits_header(oca_std="BETA2",
                 r_noise=''
                 ):
 
-    _header = OrderedDict({
-        "OCASTD": (oca_std, "OCA FITS HDU standard version"),
-        "OBSERVAT": (obs, "Cerro Armazones Observatory"),
-        "OBS-LAT": (parsed_obs_lat, f"[deg] Observatory longitude {obs_lat}"),
-        "OBS-LONG": (parsed_obs_lon, f"[deg] Observatory latitude {obs_lon}"),
-        "OBS-ELEV": (obs_elev, f"[m] Observatory elevation"),
-        "ORIGIN": (origin, "Institution created this FITS file"),
-        "TEL": (tel_id, ''),
-        "DATE-OBS": (utc_now, "DateTime of observation start"),
-        "JD": (jd, "Julian date of observation start"),
-        "RA": (req_ra, "Requested object RA"),
-        "DEC": (req_dec, "Requested object DEC"),
-        "EQUINOX": (epoch, "Requested RA DEC epoch"),
-        "TEL_RA": (tel_ra, "Telescope RA"),
-        "TEL_DEC": (tel_dec, "Telescope DEC"),
-        "TEL_ALT": (tel_alt, "[deg] Telescope mount ALT"),
-        "TEL_AZ": (tel_az, "[deg] Telescope mount AZ"),
-        "AIRMASS": (airmass, ''),
-        "OBSMODE": (obs_mode, "TRACKING, GUIDING, JITTER or ELSE"),
-        "FOCUS": (focus, "Focus position"),
-        "ROTATOR": (rotator_pos, "[deg] Rotator position"),
-        "OBSERVER": (observer, ''),
-        "OBSTYPE": (obs_type, ''),
-        "OBJECT": (object, ''),
-        "FILTER": (filter, ''),
-        "EXPREQ": (req_exp, "[s] Requested exposure time"),
-        "EXPTIME": (cam_exp, "[s] Executed exposure time"),
-        "DETSIZE": (det_size, ''),
-        "CCDSEC": (ccd_sec, ''),
-        "CCD_NAME": (ccd_name, ''),
-        "CCD_TEMP": (ccd_temp, ''),
-        "CCD_BINX": (ccd_binx, ''),
-        "CCD_BINY": (ccd_biny, ''),
-        "READ_MOD": (read_mod, ''),
-        "GAIN": (gain, ''),
-        "RNOISE": (r_noise, ''),
-    })
+    values = (oca_std, obs, parsed_obs_lat, parsed_obs_lon, obs_elev, origin,
+              tel_id, utc_now, jd, req_ra, req_dec, epoch, tel_ra, tel_dec,
+              tel_alt, tel_az, airmass, obs_mode, focus, rotator_pos, observer,
+              obs_type, object, filter, req_exp, cam_exp, det_size, ccd_sec,
+              ccd_name, ccd_temp, ccd_binx, ccd_biny, read_mod, gain, r_noise)
+
+    _header = dict(
+        (key, (value, comment)) for (key, comment), value in zip(_FITS_HEADER_TEMPLATE, values))
+    _header["OBS-LAT"] = (parsed_obs_lat, f"[deg] Observatory longitude {obs_lat}")
+    _header["OBS-LONG"] = (parsed_obs_lon, f"[deg] Observatory latitude {obs_lon}")
 
     return _header
 
 def fits_stat(array, size: int or None = None, min: bool = True, max: bool = True,
-              mean: bool = True, median: bool = True, std: bool = True):
+              mean: bool = True, median: bool = True, std: bool = True,
+              dtype=None):
     """
     Main fits statistics
     :param array: list like image data, example: [[2, 3, 4], [1, 1, 1], [2, 3, 1]]
@@ -166,14 +210,31 @@ def fits_stat(array, size: int or None = None, min: bool = True, max: bool = Tru
     :param mean: array mean, should calculate this stat, default Yes
     :param median: array median, should calculate this stat, default Yes
     :param std: array standard deviation, should calculate this stat, default Yes
+    :param dtype: accumulator type for mean/std, default None picks float32
+        for 16-bit pixel data and numpy defaults otherwise
     :return: Dict[str, float]
     """
 
     result = {}
-    narray = np.array(array)
+    narray = np.asarray(array)
     if size is not None:
         narray = array_random_subset_2d(narray, size=size)
 
+    explicit_dtype = dtype is not None
+    if dtype is None and narray.dtype in (np.int16, np.uint16):
+        # 16-bit pixels carry at most 16 significant bits, float32 is enough
+        # for mean/std and halves the memory traffic; min/max stay native
+        dtype = np.float32
+
+    if min and max and mean and std and not explicit_dtype and narray.size \
+            and _fused_min_max_mean_std is not None:
+        # one traversal instead of four separate full-array reductions;
+        # only the median needs its own pass
+        result['min'], result['max'], result['mean'], result['std'] = _fused_min_max_mean_std(narray.ravel())
+        if median:
+            result['median'] = _partition_median(narray)
+        return result
+
     if min:
         result['min'] = np.amin(narray)
 
@@ -181,16 +242,44 @@ def fits_stat(array, size: int or None = None, min: bool = True, max: bool = Tru
         result['max'] = np.amax(narray)
 
     if mean:
-        result['mean'] = np.mean(narray)
+        result['mean'] = np.mean(narray, dtype=dtype)
 
     if median:
-        result['median'] = np.median(narray)
+        result['median'] = _partition_median(narray)
 
     if std:
-        result['std'] = np.std(narray)
+        result['std'] = np.std(narray, dtype=dtype)
 
     return result
 
+def fits_stat_batch(arrays, max_workers: int or None = None, **kwargs):
+    """
+    fits_stat over a batch of images, scattered across a thread pool; the
+    NumPy reductions release the GIL, so images are processed concurrently
+    :param arrays: iterable of image arrays
+    :param max_workers: pool size, default None picks ThreadPoolExecutor default
+    :param kwargs: passed through to fits_stat
+    :return: List[Dict[str, float]], one dict per image, input order kept
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda a: fits_stat(a, **kwargs), arrays))
+
+def _partition_median(array):
+    """
+    Median via np.partition - O(N) selection instead of the full sort
+    inside np.median
+    :param array: numpy array
+    :return: median value
+    """
+    flat = array.ravel()
+    half = flat.size // 2
+    if flat.size % 2:
+        return np.float64(np.partition(flat, half)[half])
+    part = np.partition(flat, [half - 1, half])
+    # promote before adding: the sum of the two central int16/uint16 values
+    # can overflow the native dtype
+    return (part[half - 1].astype(np.float64) + part[half]) / 2
+
 def array_random_subset_2d(array, size: int, replace: bool = False):
     """
     Func randomly selecting points from array
@@ -199,7 +288,6 @@ def array_random_subset_2d(array, size: int, replace: bool = False):
     :param replace: with or without replacement
     :return: array random subset
     """
-    nrows, ncols = array.shape
-    row_indices = np.random.choice(nrows, size=size, replace=replace)
-    col_indices = np.random.choice(ncols, size=size, replace=replace)
-    return array[row_indices, col_indices]
\ No newline at end of file
+    flat = np.asarray(array).ravel()
+    indices = np.random.default_rng().choice(flat.size, size=size, replace=replace, shuffle=False)
+    return flat[indices]
\ No newline at end of file
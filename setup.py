@@ -1,5 +1,12 @@
 from setuptools import setup
 
+try:
+    # optional compiled parser for coordinates.py, pure Python works without it
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['pyaraucaria/_coordinates_c.pyx'])
+except ImportError:
+    ext_modules = []
+
 setup(
     name='pyaraucaria',
     version='2.7.10',
@@ -10,6 +17,7 @@ setup(
     author_email='',
     description='Common Routines of OCA Observatory and Araucaria Project',
     include_package_data=True,
+    ext_modules=ext_modules,
 
     package_data={'pyaraucaria': [
         'databases/Objects.database',
@@ -25,5 +33,6 @@ setup(
     ],
     extras_require={
         'yaml': ['yaml'],
+        'numba': ['numba'],
     }
 )
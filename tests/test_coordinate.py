@@ -20,6 +20,7 @@ class TestCoo(unittest.TestCase):
             ('12:34:56.1', 12.58225),
             ('-12 34 56.1', -12.58225),
             ('12.58225', 12.58225),
+            (' 12.58225 ', 12.58225),
             ('200:30:00', 200.5),
             ]
         res = [deg_to_decimal_deg(d[0]) for d in tst]
@@ -36,6 +37,27 @@ class TestCoo(unittest.TestCase):
             self.assertEqual(t, r)
 
 
+class TestArrayConversion(unittest.TestCase):
+
+    def test_ra_array_to_decimal(self):
+        tst = ['14:50:42.40', '19:50:46.68', '10 00 00']
+        res = ra_array_to_decimal(tst)
+        for t, r in zip(tst, res):
+            self.assertAlmostEqual(ra_to_decimal(t), r)
+
+    def test_ra_array_to_decimal_mixed(self):
+        tst = ['10:00:00', '150.0', '-22.5']
+        res = ra_array_to_decimal(tst)
+        for t, r in zip(tst, res):
+            self.assertAlmostEqual(ra_to_decimal(t), r)
+
+    def test_dec_array_to_decimal(self):
+        tst = ['12°34′56.1″', '-12 34 56.1', '12.58225', '74:09:19.73']
+        res = dec_array_to_decimal(tst)
+        for t, r in zip(tst, res):
+            self.assertAlmostEqual(dec_to_decimal(t), r)
+
+
 class TestRaDecEpoch(unittest.TestCase):
 
     def test_ra_dec_epoch(self):
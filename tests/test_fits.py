@@ -1,14 +1,50 @@
+import os
+import tempfile
 import unittest
-from pyaraucaria.fits import fits_stat
+from pyaraucaria.fits import fits_stat, fits_stat_batch, save_fits_from_array
+
+
+class TestSaveFitsFromArray(unittest.TestCase):
+
+    def test_sideint16_round_trip(self):
+        from astropy.io import fits
+        array = [[0, 1000], [65535, 32768]]
+        with tempfile.TemporaryDirectory() as folder:
+            save_fits_from_array(array, folder, 'side', {'TEL': 'iris'}, dtyp='sideint16')
+            with fits.open(os.path.join(folder, 'side.fits')) as hdul:
+                self.assertEqual(hdul[0].data.tolist(), array)
+                hdul[0].verify('exception')
+            with open(os.path.join(folder, 'side.fits'), 'rb') as f:
+                raw = f.read(2880).decode('ascii')
+            self.assertIn('BZERO', raw)
 
 
 class TestFitsStat(unittest.TestCase):
 
     def test_fits_stat(self):
+        # tolerance-based for mean/std: the fused numba path accumulates in a
+        # different order than the NumPy reductions
         array = [2, 5, 8, 12, 15]
-        pred_dict = {'min': 2, 'max': 15, 'median': 8.0, 'mean': 8.4, 'std': 4.673328578219169}
-        result_dict = fits_stat(array)
-        self.assertDictEqual(pred_dict, result_dict)
+        result = fits_stat(array)
+        self.assertEqual(result['min'], 2)
+        self.assertEqual(result['max'], 15)
+        self.assertEqual(result['median'], 8.0)
+        self.assertAlmostEqual(result['mean'], 8.4)
+        self.assertAlmostEqual(result['std'], 4.673328578219169)
+
+    def test_fits_stat_explicit_dtype(self):
+        import numpy as np
+        array = np.array([2, 5, 8, 12, 15], dtype=np.int16)
+        result = fits_stat(array, dtype=np.float64)
+        self.assertIsInstance(result['std'], np.float64)
+        self.assertAlmostEqual(result['std'], 4.673328578219169)
+
+    def test_fits_stat_batch(self):
+        arrays = [[2, 5, 8, 12, 15], [1, 1, 1]]
+        results = fits_stat_batch(arrays)
+        self.assertEqual(len(results), 2)
+        for array, result in zip(arrays, results):
+            self.assertDictEqual(fits_stat(array), result)
 
 
 if __name__ == '__main__':